@@ -0,0 +1,214 @@
+# results_store.py
+# Long-term SQLite store for Y-factor / G/T results and trend queries
+
+import bisect
+import math
+import os
+import sqlite3
+import statistics
+import time
+import logging
+
+SECONDS_PER_DAY = 86400.0
+
+_COLUMNS = (
+    "ts", "freq_hz", "hot_db", "cold_db", "y_factor", "gt_db",
+    "moon_az_deg", "moon_el_deg", "moon_range_km", "moon_phase_deg",
+    "center_freq", "span", "rbw", "vbw", "sweep_time", "points",
+    "ref_level", "input_att", "smoothing_window", "threshold_db",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gt_results (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    freq_hz REAL NOT NULL,
+    hot_db REAL,
+    cold_db REAL,
+    y_factor REAL,
+    gt_db REAL,
+    moon_az_deg REAL,
+    moon_el_deg REAL,
+    moon_range_km REAL,
+    moon_phase_deg REAL,
+    center_freq REAL,
+    span REAL,
+    rbw REAL,
+    vbw REAL,
+    sweep_time REAL,
+    points INTEGER,
+    ref_level REAL,
+    input_att REAL,
+    smoothing_window INTEGER,
+    threshold_db REAL
+);
+CREATE INDEX IF NOT EXISTS idx_gt_results_ts ON gt_results (ts);
+CREATE INDEX IF NOT EXISTS idx_gt_results_freq_ts ON gt_results (freq_hz, ts);
+"""
+
+
+def _setting(source, key):
+    """Read a setting from a dict snapshot or from an object's attribute."""
+    if isinstance(source, dict):
+        return source.get(key)
+    return getattr(source, key, None)
+
+
+class ResultsStore:
+    def __init__(self, db_path="data/gt_results.sqlite", batch_size=32):
+        # Relative paths resolve against the moon_tracker_gt folder, like the ephemeris
+        if db_path != ":memory:" and not os.path.isabs(db_path):
+            module_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(module_dir)))
+            db_path = os.path.join(project_root, "moon_tracker_gt", db_path)
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.pending = []
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+    def record(self, hot_db, cold_db, y_factor, gt_db, freq_hz,
+               moon=None, instrument=None, detector=None, timestamp=None):
+        """
+        Queue one measurement for storage.
+        - moon: dict from MoonTracker.get_moon_position()
+        - instrument: SpectrumICD, or a dict of its settings captured with the trace
+        - detector: SignalDetector, or a dict of smoothing_window/threshold_db
+        - timestamp: UTC epoch seconds, defaults to now
+        Rows are written in one transaction once batch_size are queued.
+        """
+        moon = moon or {}
+        if gt_db is not None and not math.isfinite(gt_db):
+            gt_db = None  # Invalid Y-factor; keep the row but out of statistics
+        row = (
+            time.time() if timestamp is None else float(timestamp),
+            float(freq_hz), hot_db, cold_db, y_factor, gt_db,
+            moon.get("azimuth_deg"), moon.get("elevation_deg"),
+            moon.get("distance_km"), moon.get("phase_deg"),
+            _setting(instrument, "center_freq"),
+            _setting(instrument, "span"),
+            _setting(instrument, "rbw"),
+            _setting(instrument, "vbw"),
+            _setting(instrument, "sweep_time"),
+            _setting(instrument, "points"),
+            _setting(instrument, "ref_level"),
+            _setting(instrument, "input_att"),
+            _setting(detector, "smoothing_window"),
+            _setting(detector, "threshold_db"),
+        )
+        self.pending.append(row)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all queued rows in a single transaction."""
+        if not self.pending:
+            return
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO gt_results ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                self.pending,
+            )
+        logging.info(f"Stored {len(self.pending)} G/T result(s) in {self.db_path}")
+        self.pending = []
+
+    def query(self, start=None, end=None, freq_min=None, freq_max=None):
+        """Return stored rows as dicts, ordered by time, within the given time/frequency range."""
+        self.flush()
+        where, params = self._where(start, end, freq_min, freq_max)
+        cur = self.conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM gt_results{where} ORDER BY ts", params
+        )
+        return [dict(zip(_COLUMNS, row)) for row in cur]
+
+    def rolling_median(self, window_days=30, start=None, end=None, freq_min=None, freq_max=None):
+        """
+        Rolling median of G/T (dB/K) over the trailing window_days.
+        Returns a list of (day_start_ts, median_gt_db), one entry per day with
+        data inside the window ending at that day's close.
+        """
+        if window_days <= 0:
+            raise ValueError("window_days must be positive")
+        ts, gt = self._gt_series(start, end, freq_min, freq_max)
+        out = []
+        window = window_days * SECONDS_PER_DAY
+        ordered = []  # Values inside the window, kept sorted as it slides
+        lo = 0
+        for i, t in enumerate(ts):
+            bisect.insort(ordered, gt[i])
+            this_day = math.floor(t / SECONDS_PER_DAY) * SECONDS_PER_DAY
+            last_in_day = i + 1 == len(ts) or ts[i + 1] >= this_day + SECONDS_PER_DAY
+            if not last_in_day:
+                continue
+            day_end = this_day + SECONDS_PER_DAY
+            while lo <= i and ts[lo] < day_end - window:
+                del ordered[bisect.bisect_left(ordered, gt[lo])]
+                lo += 1
+            if not ordered:
+                continue  # Sub-day window that ends after the day's last result
+            mid = len(ordered) // 2
+            if len(ordered) % 2:
+                median = ordered[mid]
+            else:
+                median = (ordered[mid - 1] + ordered[mid]) / 2
+            out.append((this_day, median))
+        return out
+
+    def trend(self, start=None, end=None, freq_min=None, freq_max=None):
+        """
+        Least-squares trend of G/T over the selected range.
+        Returns dict with 'slope_db_per_day', 'intercept_db' (at the first sample),
+        'median_db' and 'count', or None if fewer than two results are stored.
+        """
+        ts, gt = self._gt_series(start, end, freq_min, freq_max)
+        if len(ts) < 2 or ts[0] == ts[-1]:
+            return None
+        days = [(t - ts[0]) / SECONDS_PER_DAY for t in ts]
+        slope, intercept = statistics.linear_regression(days, gt)
+        return {
+            "slope_db_per_day": slope,
+            "intercept_db": intercept,
+            "median_db": statistics.median(gt),
+            "count": len(gt),
+        }
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def _gt_series(self, start, end, freq_min, freq_max):
+        self.flush()
+        where, params = self._where(start, end, freq_min, freq_max)
+        where += " AND gt_db IS NOT NULL" if where else " WHERE gt_db IS NOT NULL"
+        rows = self.conn.execute(
+            f"SELECT ts, gt_db FROM gt_results{where} ORDER BY ts", params
+        ).fetchall()
+        return [r[0] for r in rows], [r[1] for r in rows]
+
+    @staticmethod
+    def _where(start, end, freq_min, freq_max):
+        clauses, params = [], []
+        for column, op, value in (
+            ("freq_hz", ">=", freq_min), ("freq_hz", "<=", freq_max),
+            ("ts", ">=", start), ("ts", "<", end),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+if __name__ == "__main__":
+    store = ResultsStore(db_path=":memory:")
+    now = time.time()
+    for d in range(90):
+        store.record(10.0, 0.0, 10.0, 40.0 - 0.01 * d, 2.505e9,
+                     timestamp=now - (90 - d) * SECONDS_PER_DAY)
+    print("Last rolling median:", store.rolling_median(window_days=30)[-1])
+    print("Trend:", store.trend())
+    store.close()
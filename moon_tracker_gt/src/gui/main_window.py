@@ -3,13 +3,17 @@ from PyQt5.QtWidgets import (
     QPushButton, QLineEdit, QMessageBox, QCheckBox, QFileDialog, QGroupBox, QTabWidget
 )
 from PyQt5.QtCore import QTimer
+from datetime import datetime, timezone
+import time
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from tracking.moon_tracker import MoonTracker
 from measurement.spectrum_icd import SpectrumICD
 from measurement.signal_detector import SignalDetector
+from measurement.acquisition_worker import AcquisitionProcess
 from computation.gt_calculator import GTCalculator
+from computation.results_store import ResultsStore
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -22,6 +26,12 @@ class MainWindow(QMainWindow):
         self.spectrum = SpectrumICD(dummy=True)
         self.detector = SignalDetector(smoothing_window=3, threshold_db=2.0)
         self.gtcalc = GTCalculator(freq_hz=2.505e9)
+        self.results_store = ResultsStore(batch_size=1)  # Results are manual and rare; write each at once
+        self.acquisition = None  # Set when acquisition runs in a separate process
+        self.acquisition_running = False  # Worker has connected to the analyzer
+        self.worker_stopped = False  # Worker died; no acquisition until the user reconnects
+        self.last_seq = 0
+        self.recorded_result = None  # last_result already written to the results store
         self.connected = False
         self.tracking_live = True
         self.measurement_live = True
@@ -69,6 +79,7 @@ class MainWindow(QMainWindow):
         self.points_edit = QLineEdit(str(self.spectrum.points))
         self.dummy_checkbox = QCheckBox("Dummy Mode (Simulated)")
         self.dummy_checkbox.setChecked(self.spectrum.dummy)
+        self.process_checkbox = QCheckBox("Separate Acquisition Process")
         self.connect_btn = QPushButton("Connect")
         self.connect_btn.clicked.connect(self.connect_spectrum)
         self.connection_status = QLabel("Disconnected")
@@ -81,6 +92,7 @@ class MainWindow(QMainWindow):
         spectrum_form.addRow("Sweep Time (s):", self.sweep_edit)
         spectrum_form.addRow("Points:", self.points_edit)
         spectrum_form.addRow(self.dummy_checkbox)
+        spectrum_form.addRow(self.process_checkbox)
         spectrum_form.addRow(self.connect_btn)
         spectrum_form.addRow("Status:", self.connection_status)
         spectrum_group.setLayout(spectrum_form)
@@ -145,7 +157,15 @@ class MainWindow(QMainWindow):
         if not self.tracking_live:
             self.tracking_status.setText("Paused")
             return
-        pos = self.tracker.get_moon_position()
+        latest = None
+        if self._check_acquisition() and self.measurement_live:
+            # Position published with the newest trace; only meta is used, so no copy
+            latest = self.acquisition.bus.latest()
+        if latest is not None:
+            pos = self._moon_pos_from_meta(latest[1])
+        else:
+            # Acquisition paused or not started yet: track locally so tracking stays live
+            pos = self.tracker.get_moon_position()
         self.az_label.setText(f"{pos['azimuth_deg']:.2f}")
         self.el_label.setText(f"{pos['elevation_deg']:.2f}")
         self.utc_label.setText(f"{pos['utc']}")
@@ -175,8 +195,13 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Input Error", f"Invalid input: {e}")
             return
 
+        if self.process_checkbox.isChecked():
+            self.connect_acquisition_process()
+            return
         if self.spectrum.connect():
             self.spectrum.set_params()
+            self.connected = True
+            self.worker_stopped = False
             self.connection_status.setText("Connected")
             self.statusBar().showMessage("Connected to Spectrum Analyzer.")
             self.connect_btn.setEnabled(False)
@@ -184,17 +209,110 @@ class MainWindow(QMainWindow):
             self.connection_status.setText("Failed")
             QMessageBox.warning(self, "Connection", "Failed to connect.")
 
+    def _spectrum_settings(self):
+        return {
+            key: getattr(self.spectrum, key)
+            for key in ("ip", "port", "center_freq", "span", "rbw", "vbw",
+                        "sweep_time", "points", "ref_level", "input_att", "dummy")
+        }
+
+    def _detector_settings(self):
+        return {"smoothing_window": self.detector.smoothing_window,
+                "threshold_db": self.detector.threshold_db}
+
+    def connect_acquisition_process(self):
+        settings = self._spectrum_settings()
+        observer = self.tracker.observer
+        acquisition = AcquisitionProcess(
+            spectrum_settings=settings,
+            tracker_args={"lat": observer.latitude.degrees, "lon": observer.longitude.degrees,
+                          "elev": observer.elevation.m},
+            detector_args=self._detector_settings(),
+        )
+        # Don't block the GUI while the worker starts; the timers poll its status
+        acquisition.start()
+        if not self.measurement_live:
+            acquisition.pause()
+        self.acquisition = acquisition
+        self.acquisition_running = False
+        self.worker_stopped = False
+        self.connection_status.setText("Starting worker...")
+        self.statusBar().showMessage("Starting acquisition process.")
+        self.connect_btn.setEnabled(False)
+        self.process_checkbox.setEnabled(False)
+
+    def _check_acquisition(self):
+        """
+        Return True while the worker is running. Reports when it finishes
+        starting, and tears it down and reports if it failed or died.
+        """
+        if self.acquisition is None:
+            return False
+        status = self.acquisition.status()
+        if status == "starting":
+            return False
+        if status == "running":
+            if not self.acquisition_running:
+                self.acquisition_running = True
+                self.connection_status.setText("Connected (worker process)")
+                self.statusBar().showMessage("Acquisition running in a separate process.")
+            return True
+        if self.acquisition_running:
+            message = "Acquisition process stopped unexpectedly; reconnect to resume."
+        else:
+            message = "Failed to start acquisition process."
+        self.acquisition.stop()
+        self.acquisition = None
+        self.acquisition_running = False
+        self.worker_stopped = True
+        self.last_seq = 0
+        self.connection_status.setText("Worker stopped")
+        self.connect_btn.setEnabled(True)
+        self.process_checkbox.setEnabled(True)
+        self.statusBar().showMessage(message)
+        QMessageBox.warning(self, "Acquisition", message)
+        return False
+
+    def _moon_pos_from_meta(self, meta):
+        utc = datetime.fromtimestamp(meta["timestamp"], timezone.utc)
+        return {
+            "utc": utc.strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "azimuth_deg": meta["azimuth_deg"],
+            "elevation_deg": meta["elevation_deg"],
+            "distance_km": meta["distance_km"],
+            "phase_deg": meta["phase_deg"],
+        }
+
     def update_measurement_section(self):
+        worker_running = self._check_acquisition()
         if not self.measurement_live:
             return
-        # Get current Moon position
-        moon_pos = self.tracker.get_moon_position()
-        az = moon_pos["azimuth_deg"]
-        el = moon_pos["elevation_deg"]
-        # Get spectrum trace
-        trace = self.spectrum.get_trace()
-        # Detect hot/cold
-        result = self.detector.detect_hot_cold(trace, az, el, az, el)
+        if not worker_running and (self.acquisition is not None or self.worker_stopped):
+            return  # Worker still starting, or it stopped and the user must reconnect
+        if worker_running:
+            # Worker already tracked, acquired and detected. Copy the trace: it is kept
+            # for saving and by matplotlib, and the worker reuses the slot.
+            latest = self.acquisition.bus.latest(copy=True)
+            if latest is None or latest[0] == self.last_seq:
+                return
+            self.last_seq, meta, trace = latest
+            moon_pos = self._moon_pos_from_meta(meta)
+            result = {key: meta[key] for key in ("hot", "cold", "delta_db", "is_hot")}
+            measurement = {"timestamp": meta["timestamp"], "moon": moon_pos,
+                           "instrument": self.acquisition.spectrum_settings,
+                           "detector": self.acquisition.detector_args}
+        else:
+            # Get current Moon position
+            moon_pos = self.tracker.get_moon_position()
+            az = moon_pos["azimuth_deg"]
+            el = moon_pos["elevation_deg"]
+            # Get spectrum trace
+            trace = self.spectrum.get_trace()
+            # Detect hot/cold
+            result = self.detector.detect_hot_cold(trace, az, el, az, el)
+            measurement = {"timestamp": time.time(), "moon": moon_pos,
+                           "instrument": self._spectrum_settings(),
+                           "detector": self._detector_settings()}
         # Plot
         self.ax.clear()
         self.ax.plot(trace, label="Trace")
@@ -206,9 +324,15 @@ class MainWindow(QMainWindow):
         # Store for results section and saving
         self.last_result = result
         self.last_trace = trace
+        self.last_measurement = measurement  # Context recorded with the G/T result
 
     def toggle_measurement(self):
         self.measurement_live = not self.measurement_live
+        if self.acquisition is not None:
+            if self.measurement_live:
+                self.acquisition.resume()
+            else:
+                self.acquisition.pause()
         if self.measurement_live:
             self.measure_live_btn.setText("Pause Live")
             self.statusBar().showMessage("Measurement live updates resumed.")
@@ -239,6 +363,16 @@ class MainWindow(QMainWindow):
             gt = self.gtcalc.compute_gt(result["hot"], result["cold"])
             self.y_label.setText(f"Y-factor: {y:.2f}")
             self.gt_label.setText(f"G/T: {gt:.2f} dB/K")
+            if result is self.recorded_result:
+                self.statusBar().showMessage("G/T computed (measurement already stored).")
+                return
+            measurement = self.last_measurement
+            self.results_store.record(
+                result["hot"], result["cold"], y, gt, self.gtcalc.freq_hz,
+                moon=measurement["moon"], instrument=measurement["instrument"],
+                detector=measurement["detector"], timestamp=measurement["timestamp"],
+            )
+            self.recorded_result = result
             self.statusBar().showMessage("G/T computed.")
         except Exception as e:
             QMessageBox.warning(self, "Error", str(e))
@@ -246,4 +380,10 @@ class MainWindow(QMainWindow):
     def clear_results(self):
         self.y_label.setText("Y-factor: --")
         self.gt_label.setText("G/T: --")
-        self.statusBar().showMessage("Results cleared.")
\ No newline at end of file
+        self.statusBar().showMessage("Results cleared.")
+
+    def closeEvent(self, event):
+        if self.acquisition is not None:
+            self.acquisition.stop()
+        self.results_store.close()
+        super().closeEvent(event)
\ No newline at end of file
@@ -1,8 +1,11 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from gui.main_window import MainWindow
 
 def main():
+    # Imported here so the spawned acquisition worker, which re-imports this
+    # module as __mp_main__, does not load Qt or the GUI
+    from PyQt5.QtWidgets import QApplication
+    from gui.main_window import MainWindow
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
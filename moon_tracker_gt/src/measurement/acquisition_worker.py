@@ -0,0 +1,149 @@
+# acquisition_worker.py
+# Runs tracking, trace acquisition and hot/cold detection in a separate process
+
+import logging
+import multiprocessing as mp
+import time
+
+from .trace_bus import TraceBus
+
+
+def run_acquisition(bus_name, spectrum_settings, tracker_args, detector_args,
+                    period_s, stop_event, run_event, ready_event, tracker_cls=None):
+    """
+    Worker loop: track the Moon, acquire a trace, detect hot/cold and publish to the bus.
+    tracker_cls defaults to MoonTracker; any class with get_moon_position() works.
+    """
+    if tracker_cls is None:
+        try:
+            from tracking.moon_tracker import MoonTracker
+        except ImportError:
+            from src.tracking.moon_tracker import MoonTracker
+        tracker_cls = MoonTracker
+    from .spectrum_icd import SpectrumICD
+    from .signal_detector import SignalDetector
+
+    # Exit if the GUI dies without calling stop(); daemon=True only covers a clean exit
+    parent = mp.parent_process()
+    bus = TraceBus.attach(bus_name)
+    tracker = tracker_cls(**tracker_args)
+    detector = SignalDetector(**detector_args)
+    spectrum = SpectrumICD(dummy=spectrum_settings.get("dummy", False))
+    for key, value in spectrum_settings.items():
+        setattr(spectrum, key, value)
+    try:
+        if not spectrum.connect():
+            return
+        spectrum.set_params()
+        ready_event.set()
+        while not stop_event.is_set() and (parent is None or parent.is_alive()):
+            if not run_event.is_set():
+                stop_event.wait(period_s)
+                continue
+            start = time.monotonic()
+            pos = tracker.get_moon_position()
+            az, el = pos["azimuth_deg"], pos["elevation_deg"]
+            trace = spectrum.get_trace()
+            result = detector.detect_hot_cold(trace, az, el, az, el)
+            bus.publish(trace, timestamp=time.time(), **pos, **result)
+            stop_event.wait(max(0.0, period_s - (time.monotonic() - start)))
+    except Exception:
+        # The GUI notices the process has exited; leave the cause in the log
+        logging.exception("Acquisition worker stopped")
+    finally:
+        spectrum.close()
+        bus.close()
+
+
+class AcquisitionProcess:
+    """
+    Owns the shared TraceBus and the worker process that fills it.
+    The GUI reads traces from self.bus; the worker never touches Qt.
+    The spawned child re-imports the parent's __main__ module as __mp_main__,
+    so entry points must keep Qt imports under their main guard.
+    """
+
+    def __init__(self, spectrum_settings, tracker_args, detector_args, period_s=1.0, slots=8,
+                 tracker_cls=None):
+        self.spectrum_settings = dict(spectrum_settings)
+        self.tracker_args = dict(tracker_args)
+        self.detector_args = dict(detector_args)
+        self.period_s = period_s
+        self.slots = slots
+        self.tracker_cls = tracker_cls
+        self.bus = None
+        self.proc = None
+        self.deadline = None
+        # Spawn rather than fork: the parent holds Qt and socket state
+        self.ctx = mp.get_context("spawn")
+        self.stop_event = self.ctx.Event()
+        self.run_event = self.ctx.Event()
+        self.ready_event = self.ctx.Event()
+
+    def start(self, timeout=30.0):
+        """
+        Launch the worker without waiting for it. Poll status() (or call
+        wait_ready()) to learn whether it connected within timeout seconds.
+        """
+        self.bus = TraceBus(slots=self.slots, points=int(self.spectrum_settings.get("points", 1001)))
+        self.run_event.set()
+        self.proc = self.ctx.Process(
+            target=run_acquisition,
+            args=(self.bus.name, self.spectrum_settings, self.tracker_args, self.detector_args,
+                  self.period_s, self.stop_event, self.run_event, self.ready_event,
+                  self.tracker_cls),
+            daemon=True,
+        )
+        self.proc.start()
+        self.deadline = time.monotonic() + timeout
+
+    def status(self):
+        """'starting' until the worker connects, then 'running'; 'failed' once it exits or times out."""
+        if self.proc is None or not self.proc.is_alive():
+            return "failed"
+        if self.ready_event.is_set():
+            return "running"
+        if time.monotonic() > self.deadline:
+            logging.warning("Acquisition process did not connect in time.")
+            return "failed"
+        return "starting"
+
+    def wait_ready(self):
+        """Block until the worker has connected or failed. Returns True if it is running."""
+        status = self.status()
+        while status == "starting":
+            self.ready_event.wait(0.1)
+            status = self.status()
+        return status == "running"
+
+    def pause(self):
+        self.run_event.clear()
+
+    def resume(self):
+        self.run_event.set()
+
+    def stop(self, timeout=5.0):
+        self.stop_event.set()
+        self.run_event.set()
+        if self.proc is not None:
+            self.proc.join(timeout)
+            if self.proc.is_alive():
+                self.proc.terminate()
+            self.proc = None
+        if self.bus is not None:
+            self.bus.close()
+            self.bus = None
+
+if __name__ == "__main__":
+    # Run from moon_tracker_gt/ with: python -m src.measurement.acquisition_worker
+    acq = AcquisitionProcess(
+        spectrum_settings={"dummy": True, "points": 1001},
+        tracker_args={"lat": 40.0, "lon": -75.0, "elev": 100.0},
+        detector_args={"smoothing_window": 3, "threshold_db": 2.0},
+    )
+    acq.start()
+    if acq.wait_ready():
+        time.sleep(3)
+        seq, meta, trace = acq.bus.latest()
+        print(f"Seq {seq}: hot={meta['hot']:.2f} cold={meta['cold']:.2f} points={len(trace)}")
+    acq.stop()
@@ -0,0 +1,144 @@
+# trace_bus.py
+# Shared-memory ring buffer for passing traces between processes
+
+from multiprocessing import shared_memory
+import time
+import numpy as np
+
+# Per-slot detection/tracking values, stored as float64 next to the trace
+META_FIELDS = (
+    "timestamp", "azimuth_deg", "elevation_deg", "distance_km", "phase_deg",
+    "hot", "cold", "delta_db", "is_hot",
+)
+_HEADER_LEN = 4  # last published sequence, slots, points, reserved
+
+
+class TraceBus:
+    """
+    Single-writer ring buffer in shared memory.
+    The writer bumps a sequence counter after each trace; readers map the
+    same block and get NumPy views of the trace without copying. Each slot
+    carries its own sequence number (negative while being written) so a
+    reader can tell whether the slot it holds has since been overwritten.
+    """
+
+    def __init__(self, name=None, slots=8, points=1001, create=True):
+        if create:
+            if slots < 2:
+                raise ValueError("TraceBus needs at least 2 slots so readers never share the slot being written")
+            size = self._nbytes(slots, points)
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            header = np.ndarray((_HEADER_LEN,), dtype=np.int64, buffer=self.shm.buf)
+            slots, points = int(header[1]), int(header[2])
+        self.owner = create
+        self.name = self.shm.name
+        self.slots = slots
+        self.points = points
+        self._map()
+        if create:
+            self.header[:] = (0, slots, points, 0)
+            self.seqs[:] = 0
+
+    @classmethod
+    def attach(cls, name):
+        """Map an existing bus created by another process."""
+        return cls(name=name, create=False)
+
+    @staticmethod
+    def _nbytes(slots, points):
+        return 8 * (_HEADER_LEN + 2 * slots + slots * len(META_FIELDS) + slots * points)
+
+    def _map(self):
+        buf = self.shm.buf
+        offset = 0
+        self.header = np.ndarray((_HEADER_LEN,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8 * _HEADER_LEN
+        self.seqs = np.ndarray((self.slots,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8 * self.slots
+        self.lengths = np.ndarray((self.slots,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8 * self.slots
+        self.meta = np.ndarray((self.slots, len(META_FIELDS)), dtype=np.float64, buffer=buf, offset=offset)
+        offset += 8 * self.slots * len(META_FIELDS)
+        self.traces = np.ndarray((self.slots, self.points), dtype=np.float64, buffer=buf, offset=offset)
+
+    def publish(self, trace, **meta):
+        """Write a trace and its META_FIELDS values into the next slot. Returns its sequence number."""
+        seq = int(self.header[0]) + 1
+        slot = seq % self.slots
+        n = min(len(trace), self.points)
+        self.seqs[slot] = -seq  # Mark in progress
+        self.traces[slot, :n] = trace[:n]
+        self.lengths[slot] = n
+        self.meta[slot] = [np.nan if meta.get(field) is None else float(meta[field])
+                           for field in META_FIELDS]
+        self.seqs[slot] = seq
+        self.header[0] = seq
+        return seq
+
+    @property
+    def last_seq(self):
+        return int(self.header[0])
+
+    def read(self, seq, copy=False):
+        """
+        Return (meta, trace) for sequence seq, or None if it was not published
+        yet or has been overwritten. With copy=False the trace is a view into
+        shared memory and stays valid only while is_current(seq) holds, i.e.
+        for the next slots - 1 publishes.
+        """
+        if seq <= 0:
+            return None
+        slot = seq % self.slots
+        if self.seqs[slot] != seq:
+            return None
+        n = int(self.lengths[slot])
+        trace = self.traces[slot, :n]
+        meta = dict(zip(META_FIELDS, self.meta[slot].tolist()))
+        if copy:
+            trace = trace.copy()
+        if self.seqs[slot] != seq:  # Writer lapped us while reading
+            return None
+        meta["is_hot"] = bool(meta["is_hot"])
+        return meta, trace
+
+    def latest(self, copy=False, retries=3):
+        """
+        Return (seq, meta, trace) for the newest trace, or None if nothing is
+        published or the writer kept lapping the reader for all retries.
+        """
+        for attempt in range(retries):
+            seq = self.last_seq
+            if seq == 0:
+                return None
+            item = self.read(seq, copy=copy)
+            if item is not None:
+                return (seq,) + item
+            time.sleep(0.001 * (attempt + 1))
+        return None
+
+    def is_current(self, seq):
+        """True while the slot for seq has not been reused by the writer."""
+        return seq > 0 and self.seqs[seq % self.slots] == seq
+
+    def close(self):
+        # Drop the NumPy views before releasing the mapping
+        self.header = self.seqs = self.lengths = self.meta = self.traces = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # A caller still holds a trace view; the mapping goes away with the process
+        if self.owner:
+            self.shm.unlink()
+
+if __name__ == "__main__":
+    bus = TraceBus(slots=4, points=5)
+    reader = TraceBus.attach(bus.name)
+    for i in range(6):
+        bus.publish([float(i)] * 5, timestamp=i, hot=10.0, cold=1.0)
+    seq, meta, trace = reader.latest()
+    print("Latest:", seq, meta, trace)
+    print("Seq 1 still current:", reader.is_current(1))
+    reader.close()
+    bus.close()
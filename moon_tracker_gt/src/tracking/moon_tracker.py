@@ -1,4 +1,5 @@
 from skyfield.api import load, load_file, Topos
+from skyfield import almanac
 from datetime import datetime, timezone
 import time
 import os
@@ -18,11 +19,13 @@ class MoonTracker:
         t = self.ts.utc(datetime.now(timezone.utc))
         astrometric = (self.eph['earth'] + self.observer).at(t).observe(self.moon).apparent()
         alt, az, distance = astrometric.altaz()
+        phase = almanac.moon_phase(self.eph, t)  # 0 = new, 180 = full
         return {
             "utc": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
             "azimuth_deg": round(az.degrees, 2),
             "elevation_deg": round(alt.degrees, 2),
-            "distance_km": round(distance.km, 0)
+            "distance_km": round(distance.km, 0),
+            "phase_deg": round(phase.degrees, 2)
         }
 
 if __name__ == "__main__":
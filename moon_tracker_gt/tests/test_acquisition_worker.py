@@ -0,0 +1,69 @@
+# test_acquisition_worker.py
+# Cross-process test of the acquisition worker and trace bus (dummy analyzer)
+
+import time
+import unittest
+from multiprocessing import shared_memory
+from src.measurement.acquisition_worker import AcquisitionProcess
+
+class StubTracker:
+    """Stands in for MoonTracker so the worker needs no ephemeris file."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def get_moon_position(self):
+        return {"utc": "", "azimuth_deg": 180.0, "elevation_deg": 45.0,
+                "distance_km": 384400.0, "phase_deg": 90.0}
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+class TestAcquisitionProcess(unittest.TestCase):
+    def setUp(self):
+        self.acq = AcquisitionProcess(
+            spectrum_settings={"dummy": True, "points": 101},
+            tracker_args={},
+            detector_args={"smoothing_window": 3, "threshold_db": 2.0},
+            period_s=0.05,
+            tracker_cls=StubTracker,
+        )
+
+    def tearDown(self):
+        self.acq.stop()
+
+    def test_publish_pause_resume_stop(self):
+        self.acq.start()
+        self.assertIn(self.acq.status(), ("starting", "running"))
+        self.assertTrue(self.acq.wait_ready())
+        self.assertEqual(self.acq.status(), "running")
+        bus = self.acq.bus
+        self.assertTrue(wait_for(lambda: bus.last_seq >= 1))
+        seq, meta, trace = bus.latest(copy=True)
+        self.assertEqual(len(trace), 101)
+        self.assertEqual(meta["azimuth_deg"], 180.0)
+        self.assertEqual(meta["phase_deg"], 90.0)
+
+        self.acq.pause()
+        time.sleep(0.3)  # Let an in-flight iteration finish
+        paused_seq = bus.last_seq
+        time.sleep(0.3)
+        self.assertEqual(bus.last_seq, paused_seq)
+
+        self.acq.resume()
+        self.assertTrue(wait_for(lambda: bus.last_seq > paused_seq))
+
+        proc, name = self.acq.proc, bus.name
+        self.acq.stop()
+        self.assertFalse(proc.is_alive())
+        self.assertIsNone(self.acq.bus)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# test_results_store.py
+# Unit tests for the long-term G/T results store
+
+import os
+import tempfile
+import unittest
+from src.computation.results_store import ResultsStore, SECONDS_PER_DAY
+
+class TestResultsStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "gt_results.sqlite")
+        self.store = ResultsStore(db_path=self.db_path, batch_size=10)
+        self.t0 = 1.7e9
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_batched_writes(self):
+        """Rows are held until the batch fills, then written together."""
+        for i in range(9):
+            self.store.record(10.0, 0.0, 10.0, 40.0, 2.505e9, timestamp=self.t0 + i)
+        self.assertEqual(len(self.store.pending), 9)
+        self.store.record(10.0, 0.0, 10.0, 40.0, 2.505e9, timestamp=self.t0 + 9)
+        self.assertEqual(len(self.store.pending), 0)
+        count = self.store.conn.execute("SELECT COUNT(*) FROM gt_results").fetchone()[0]
+        self.assertEqual(count, 10)
+
+    def test_records_context(self):
+        """Moon position, instrument and detector settings are stored with each result."""
+        class Instrument:
+            center_freq, span, rbw, points = 2.505e9, 5e6, 10e3, 1001
+        class Detector:
+            smoothing_window, threshold_db = 3, 2.0
+        moon = {"azimuth_deg": 180.0, "elevation_deg": 45.0,
+                "distance_km": 384400.0, "phase_deg": 170.0}
+        self.store.record(10.0, 0.0, 10.0, 40.0, 2.505e9, moon=moon,
+                          instrument=Instrument(), detector=Detector(), timestamp=self.t0)
+        self.store.close()
+        reopened = ResultsStore(db_path=self.db_path)
+        row = reopened.query()[0]
+        reopened.close()
+        self.assertEqual(row["moon_el_deg"], 45.0)
+        self.assertEqual(row["moon_phase_deg"], 170.0)
+        self.assertEqual(row["points"], 1001)
+        self.assertEqual(row["smoothing_window"], 3)
+        self.assertIsNone(row["vbw"])
+
+    def test_records_settings_snapshot(self):
+        """Settings captured as dicts with the trace are stored like live objects."""
+        self.store.record(10.0, 0.0, 10.0, 40.0, 2.505e9,
+                          instrument={"center_freq": 2.505e9, "points": 501},
+                          detector={"threshold_db": 2.0}, timestamp=self.t0)
+        row = self.store.query()[0]
+        self.assertEqual(row["ts"], self.t0)
+        self.assertEqual(row["points"], 501)
+        self.assertEqual(row["threshold_db"], 2.0)
+        self.assertIsNone(row["smoothing_window"])
+
+    def test_invalid_gt_excluded_from_statistics(self):
+        self.store.record(0.0, 0.0, 1.0, float("-inf"), 2.505e9, timestamp=self.t0)
+        self.assertIsNone(self.store.query()[0]["gt_db"])
+        self.assertEqual(self.store.rolling_median(), [])
+        self.assertIsNone(self.store.trend())
+
+    def test_rolling_median_and_trend(self):
+        for d in range(60):
+            self.store.record(10.0, 0.0, 10.0, 40.0 - 0.1 * d, 2.505e9,
+                              timestamp=self.t0 + d * SECONDS_PER_DAY)
+        # A different band must not leak into the query
+        self.store.record(10.0, 0.0, 10.0, 0.0, 8.4e9, timestamp=self.t0)
+        medians = self.store.rolling_median(window_days=3, freq_max=3e9)
+        self.assertEqual(len(medians), 60)
+        self.assertAlmostEqual(medians[-1][1], 40.0 - 0.1 * 58)
+        trend = self.store.trend(freq_max=3e9)
+        self.assertEqual(trend["count"], 60)
+        self.assertAlmostEqual(trend["slope_db_per_day"], -0.1)
+        self.assertAlmostEqual(trend["intercept_db"], 40.0)
+
+    def test_rolling_median_matches_reference(self):
+        """Incremental window median agrees with statistics.median, including even-sized windows."""
+        import random
+        import statistics
+        rng = random.Random(0)
+        values = [rng.gauss(40.0, 1.0) for _ in range(200)]
+        stamps = [self.t0 + i * SECONDS_PER_DAY / 4 for i in range(200)]
+        for t, v in zip(stamps, values):
+            self.store.record(10.0, 0.0, 10.0, v, 2.505e9, timestamp=t)
+        medians = self.store.rolling_median(window_days=2)
+        self.assertEqual(len(medians), 51)
+        for day, median in medians:
+            day_end = day + SECONDS_PER_DAY
+            window = [v for t, v in zip(stamps, values)
+                      if day_end - 2 * SECONDS_PER_DAY <= t < day_end]
+            self.assertAlmostEqual(median, statistics.median(window))
+
+    def test_rolling_median_sub_day_window(self):
+        """Windows shorter than a day only see results near the day's close."""
+        day = 19675 * SECONDS_PER_DAY
+        for hour, value in ((1, 30.0), (22, 40.0), (23, 42.0)):
+            self.store.record(10.0, 0.0, 10.0, value, 2.505e9, timestamp=day + hour * 3600)
+        self.store.record(10.0, 0.0, 10.0, 50.0, 2.505e9,
+                          timestamp=day + SECONDS_PER_DAY + 3600)
+        medians = self.store.rolling_median(window_days=3 / 24)
+        self.assertEqual(medians, [(day, 41.0)])
+        with self.assertRaises(ValueError):
+            self.store.rolling_median(window_days=0)
+
+    def test_time_range(self):
+        for d in range(10):
+            self.store.record(10.0, 0.0, 10.0, 40.0, 2.505e9,
+                              timestamp=self.t0 + d * SECONDS_PER_DAY)
+        rows = self.store.query(start=self.t0 + 2 * SECONDS_PER_DAY,
+                                end=self.t0 + 5 * SECONDS_PER_DAY)
+        self.assertEqual(len(rows), 3)
+
+if __name__ == "__main__":
+    unittest.main()
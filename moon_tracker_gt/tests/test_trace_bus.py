@@ -0,0 +1,60 @@
+# test_trace_bus.py
+# Unit tests for the shared-memory trace bus
+
+import unittest
+from src.measurement.trace_bus import TraceBus
+
+class TestTraceBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = TraceBus(slots=4, points=10)
+        self.reader = TraceBus.attach(self.bus.name)
+
+    def tearDown(self):
+        self.reader.close()
+        self.bus.close()
+
+    def test_attach_reads_layout(self):
+        self.assertEqual(self.reader.slots, 4)
+        self.assertEqual(self.reader.points, 10)
+        self.assertIsNone(self.reader.latest())
+
+    def test_publish_and_read_latest(self):
+        self.bus.publish([1.0] * 10, timestamp=100.0, azimuth_deg=180.0,
+                         hot=10.0, cold=1.0, delta_db=9.0, is_hot=True)
+        seq, meta, trace = self.reader.latest()
+        self.assertEqual(seq, 1)
+        self.assertEqual(meta["azimuth_deg"], 180.0)
+        self.assertTrue(meta["is_hot"])
+        self.assertEqual(list(trace), [1.0] * 10)
+
+    def test_zero_copy_view(self):
+        """Reader trace is a view into shared memory, not a copy."""
+        self.bus.publish([1.0] * 10)
+        _, _, trace = self.reader.latest()
+        self.assertFalse(trace.flags.owndata)
+        _, _, copied = self.reader.latest(copy=True)
+        self.assertTrue(copied.flags.owndata)
+
+    def test_short_trace(self):
+        self.bus.publish([2.0] * 3)
+        _, _, trace = self.reader.latest()
+        self.assertEqual(len(trace), 3)
+
+    def test_overwritten_slot(self):
+        """A sequence number stops being readable once the ring wraps around onto it."""
+        for i in range(4):
+            self.bus.publish([float(i)] * 10)
+        self.assertTrue(self.reader.is_current(1))
+        self.bus.publish([4.0] * 10)
+        self.assertFalse(self.reader.is_current(1))
+        self.assertIsNone(self.reader.read(1))
+        seq, _, trace = self.reader.latest()
+        self.assertEqual(seq, 5)
+        self.assertEqual(trace[0], 4.0)
+
+    def test_requires_two_slots(self):
+        with self.assertRaises(ValueError):
+            TraceBus(slots=1, points=10)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,7 +20,7 @@ class TestMoonTracker(unittest.TestCase):
     def test_position_output_keys(self):
         """Test that output dictionary has all required keys."""
         pos = self.tracker.get_moon_position()
-        for key in ("azimuth_deg", "elevation_deg", "utc", "distance_km"):
+        for key in ("azimuth_deg", "elevation_deg", "utc", "distance_km", "phase_deg"):
             self.assertIn(key, pos)
 
     def test_position_value_types(self):